@@ -1,4 +1,16 @@
 # __init__.py
-from .main import DirectusClient
+from .main import DirectusClient, DirectusQueryBuilder, DOp
 
-__all__ = ['DirectusClient']
\ No newline at end of file
+__all__ = ['DirectusClient', 'DirectusQueryBuilder', 'DOp', 'SQLToDirectusConverter',
+           'AsyncDirectusClient']
+
+
+def __getattr__(name):
+    # Lazy imports: sqlparse / aiohttp are only loaded when actually requested
+    if name == 'SQLToDirectusConverter':
+        from .sql_converter import SQLToDirectusConverter
+        return SQLToDirectusConverter
+    if name == 'AsyncDirectusClient':
+        from .async_main import AsyncDirectusClient
+        return AsyncDirectusClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
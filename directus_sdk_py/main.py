@@ -1,19 +1,79 @@
-import sys
-
 import requests
-from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlencode
 import urllib3
 from urllib3.exceptions import InsecureRequestWarning
-from typing import Dict, List, Union, Optional, Any
-import os, json
+from urllib3.util.retry import Retry
+from typing import Dict, List, Union, Any
+import os, json, shutil, time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 
-import sqlparse
-from sqlparse.sql import Where, Comparison, Identifier, Token
-from sqlparse.tokens import Keyword
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Streams multipart uploads instead of buffering the file in memory
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+try:
+    # Advertise Brotli only when a decoder is importable, otherwise the
+    # server would send bodies urllib3 cannot decompress
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+
+def _json_dumps(obj) -> bytes:
+    """
+    Serialize a request body to JSON bytes, with orjson when available.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(response):
+    """
+    Parse a response body as JSON, with orjson when available.
+
+    orjson decodes the raw bytes directly, skipping the charset detection
+    and str decode that response.json() performs first.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# Process-wide guard so constructing many clients only mutes the
+# InsecureRequestWarning once
+_WARN_DISABLED = False
+
+
+# MIME types by lowercase file extension, used by define_file_type
+_MIME_BY_EXT = {
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "webp": "image/webp",
+    "gif": "image/gif",
+    "pdf": "application/pdf",
+    "doc": "application/msword",
+    "docx": "application/msword",
+    "xls": "application/vnd.ms-excel",
+    "xlsx": "application/vnd.ms-excel",
+    "odt": "application/vnd.oasis.opendocument.text",
+    "ods": "application/vnd.oasis.opendocument.spreadsheet",
+}
 
 class DirectusClient:
-    def __init__(self, url: str, token: str = None, email: str = None, password: str = None, verify: bool = False):
+    def __init__(self, url: str, token: str = None, email: str = None, password: str = None, verify: bool = False,
+                 http2: bool = False, timeout: float = None):
         """
         Initialize the DirectusClient.
 
@@ -23,15 +83,53 @@ class DirectusClient:
             email (str): The email for authentication (optional).
             password (str): The password for authentication (optional).
             verify (bool): Whether to verify SSL certificates (default: False).
+            http2 (bool): Use an httpx.Client with HTTP/2 multiplexing instead of
+                requests. Requires the httpx package (default: False).
+            timeout (float): Request timeout in seconds for the httpx transport
+                (default: None, no timeout, matching the requests transport).
         """
+        global _WARN_DISABLED
         self.verify = verify
-        if not self.verify:
+        if not self.verify and not _WARN_DISABLED:
             urllib3.disable_warnings(category=InsecureRequestWarning)
-        
+            _WARN_DISABLED = True
+
+        self.http2 = http2
+        if http2:
+            try:
+                import httpx
+            except ImportError:
+                raise ImportError("http2=True requires the httpx package: pip install 'directus-sdk-py[http2]'")
+            # One HTTP/2 connection multiplexes concurrent requests, so
+            # parallel workloads don't need one socket per in-flight call.
+            # timeout=None by default: httpx's implicit 5s limit would fail
+            # long transfers that the requests transport completes
+            self.session = httpx.Client(http2=True, verify=self.verify, timeout=timeout)
+        else:
+            self.session = requests.Session()
+            self.session.verify = self.verify
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=50,
+                max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+            )
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+            # Compressed list responses: large get_items payloads shrink
+            # several-fold on the wire
+            self.session.headers["Accept-Encoding"] = _ACCEPT_ENCODING
+
         self.url = url
+        self._base = url.rstrip("/")
+        # Schema lookups (pk fields, collection existence) memoized with a
+        # short TTL: (deadline, value) keyed by kind:collection
+        self._schema_cache: Dict[str, tuple] = {}
+        self._items_urls: Dict[str, str] = {}
+        self._token_expiry = None
         if token is not None:
             self.static_token = token
             self.temporary_token = None
+            self._set_auth_header()
         elif email is not None and password is not None:
             self.email = email
             self.password = password
@@ -40,8 +138,125 @@ class DirectusClient:
         else:
             self.static_token = None
             self.temporary_token = None
-            
 
+    def _items_url(self, collection_name: str) -> str:
+        """
+        Full /items URL for a collection, cached per collection name so the
+        hot item methods skip repeated string formatting.
+        """
+        url = self._items_urls.get(collection_name)
+        if url is None:
+            url = self._base + "/items/" + collection_name
+            self._items_urls[collection_name] = url
+        return url
+
+    def _stream_to_file(self, url: str, file_path: str, params: dict = None) -> None:
+        """
+        Stream a GET response body to a local file, whatever the transport.
+
+        requests and httpx expose streaming differently, so the branch lives
+        here instead of in every download method.
+        """
+        self._ensure_auth()
+        if self.http2:
+            with self.session.stream("GET", url, params=params) as response:
+                if response.status_code != 200:
+                    response.read()
+                    raise AssertionError(response.text)
+                with open(file_path, "wb") as file:
+                    for chunk in response.iter_bytes():
+                        file.write(chunk)
+            return
+
+        with self.session.get(url, params=params, stream=True) as response:
+            if response.status_code != 200:
+                raise AssertionError(response.text)
+            response.raw.decode_content = True
+            with open(file_path, "wb") as file:
+                shutil.copyfileobj(response.raw, file)
+
+    def _prepare_json(self, kwargs: dict) -> dict:
+        """
+        Pre-serialize a json= keyword argument to bytes.
+
+        This bypasses requests' slower built-in encoder and lets orjson kick
+        in when installed; Content-Type is set accordingly. Raw body bytes
+        are passed as content= on httpx and data= on requests.
+        """
+        payload = kwargs.pop('json', None)
+        if payload is not None:
+            kwargs['content' if self.http2 else 'data'] = _json_dumps(payload)
+            kwargs.setdefault('headers', {}).setdefault('Content-Type', 'application/json')
+        return kwargs
+
+    def _set_auth_header(self) -> None:
+        """
+        Sync the session's Authorization header with the active token.
+
+        Called whenever the token changes (init, login, refresh, logout) so
+        request methods never have to rebuild the header per call.
+        """
+        token = self.get_token()
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+        else:
+            self.session.headers.pop("Authorization", None)
+
+    _SCHEMA_TTL = 60  # seconds before a cached schema lookup is re-fetched
+
+    def _schema_cached(self, key: str, fetch):
+        """
+        Memoize a schema lookup for _SCHEMA_TTL seconds.
+
+        Args:
+            key (str): Cache key, e.g. "pk:articles".
+            fetch: Zero-argument callable performing the real request.
+
+        Returns:
+            The cached or freshly fetched value.
+        """
+        entry = self._schema_cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now < entry[0]:
+            return entry[1]
+        value = fetch()
+        self._schema_cache[key] = (now + self._SCHEMA_TTL, value)
+        return value
+
+    def _record_expiry(self, expires_ms) -> None:
+        """
+        Remember when the temporary token expires, with a 30s safety margin.
+
+        Args:
+            expires_ms (int): Token lifetime in milliseconds, as returned by
+                the /auth endpoints.
+        """
+        if expires_ms:
+            self._token_expiry = time.monotonic() + expires_ms / 1000 - 30
+        else:
+            self._token_expiry = None
+
+    def _ensure_auth(self) -> None:
+        """
+        Refresh the temporary token only when it is close to expiry.
+
+        Static tokens never rotate, so for them (and fresh temporary
+        tokens) this is a single comparison on the hot path.
+        """
+        if self._token_expiry is not None and time.monotonic() >= self._token_expiry:
+            self.refresh(self.refresh_token)
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and its pooled connections.
+        """
+        self.session.close()
+
+    def __enter__(self) -> 'DirectusClient':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def login(self, email: str = None, password: str = None) -> tuple:
         """
@@ -61,21 +276,22 @@ class DirectusClient:
             self.email = email
             self.password = password
 
-        auth = requests.post(
+        auth = _json_loads(self.session.post(
             f"{self.url}/auth/login",
-            json={"email": email, "password": password},
-            verify=self.verify
-        ).json()
-        
+            json={"email": email, "password": password}
+        ))
+
         if 'errors' in auth:
             return {"errors": auth['errors'][0]['message']}
 
         auth = auth['data']
-        
+
         self.static_token = None
         self.temporary_token = auth['access_token']
         self.refresh_token = auth['refresh_token']
         self.expires = auth['expires']
+        self._record_expiry(auth['expires'])
+        self._set_auth_header()
         return auth
     
     def logout(self, refresh_token: str = None) -> None:
@@ -87,14 +303,14 @@ class DirectusClient:
         """
         if refresh_token is None:
             refresh_token = self.refresh_token
-        requests.post(
+        self.session.post(
             f"{self.url}/auth/logout",
-            headers={"Authorization": f"Bearer {self.get_token()}"},
-            json={"refresh_token": refresh_token},
-            verify=self.verify
+            json={"refresh_token": refresh_token}
         )
         self.temporary_token = None
         self.refresh_token = None
+        self._token_expiry = None
+        self._set_auth_header()
 
     def refresh(self, refresh_token: str = None) -> None:
         """
@@ -103,16 +319,17 @@ class DirectusClient:
         Args:
             refresh_token (str): The refresh token (optional).
         """
-        auth = requests.post(
+        auth = _json_loads(self.session.post(
             f"{self.url}/auth/refresh",
-            json={"refresh_token": refresh_token, 'mode': 'json'},
-            verify=self.verify
-        ).json()
+            json={"refresh_token": refresh_token, 'mode': 'json'}
+        ))
         if "data" in auth:
             auth = auth['data']
             self.temporary_token = auth['access_token']
             self.refresh_token = auth['refresh_token']
             self.expires = auth['expires']
+            self._record_expiry(auth['expires'])
+            self._set_auth_header()
         else:
             raise Exception(auth)
         
@@ -136,17 +353,23 @@ class DirectusClient:
     
     def clean_url(self, domain: str, path: str) -> str:
         """
-        Clean the URL by removing any leading slash.
+        Build the full URL for an API path.
+
+        The base is precomputed once in __init__, so this is a plain string
+        concatenation instead of a urljoin parse per request.
 
         Args:
+            domain (str): The instance URL (kept for backwards compatibility, unused).
             path (str): The URL path.
 
         Returns:
-            str: The cleaned URL path.
+            str: The full URL.
         """
-        clean_path = urljoin(domain, path)
-        clean_path = clean_path.replace("//", "/") if not clean_path.startswith("http://") and not clean_path.startswith("https://") and not clean_path.startswith("//") else clean_path
-        return clean_path
+        if path.startswith("http://") or path.startswith("https://"):
+            return path
+        if not path.startswith("/"):
+            path = "/" + path
+        return self._base + path
         
     
     def get(self, path, output_type: str = "json", **kwargs):
@@ -161,18 +384,26 @@ class DirectusClient:
         Returns:
             dict or str: The response data.
         """
-        data = requests.get(
+        self._ensure_auth()
+        data = self.session.get(
             self.clean_url(self.url, path),
-            headers={"Authorization": f"Bearer {self.get_token()}"},
-            verify=self.verify,
             **kwargs
         )
-        if 'errors' in data.text:
-            raise AssertionError(data.json()['errors'])
         if output_type == 'csv':
+            if data.status_code != 200:
+                raise AssertionError(data.text)
             return data.text
 
-        return data.json()['data']
+        try:
+            payload = _json_loads(data)
+        except ValueError:
+            # Non-JSON body (e.g. a gateway error page): surface it the
+            # same way as an API error instead of a decode traceback
+            raise AssertionError(data.text)
+        if 'errors' in payload:
+            raise AssertionError(payload['errors'])
+
+        return payload['data']
 
     def post(self, path, **kwargs):
         """
@@ -185,16 +416,15 @@ class DirectusClient:
         Returns:
             dict: The response data.
         """
-        response = requests.post(
+        self._ensure_auth()
+        response = self.session.post(
             self.clean_url(self.url, path),
-            headers={"Authorization": f"Bearer {self.get_token()}"},
-            verify=self.verify,
-            **kwargs
+            **self._prepare_json(kwargs)
         )
         if response.status_code != 200:
             raise AssertionError(response.text)
 
-        return response.json()
+        return _json_loads(response)
 
     def search(self, path, query: Dict = None, **kwargs):
         """
@@ -208,14 +438,14 @@ class DirectusClient:
         Returns:
             dict: The response data.
         """
-        headers = {"Authorization": f"Bearer {self.get_token()}"}
-        response = requests.request("SEARCH", self.clean_url(self.url, path), headers=headers, json=query, verify=self.verify,
-                                    **kwargs)
+        self._ensure_auth()
+        kwargs['json'] = query
+        response = self.session.request("SEARCH", self.clean_url(self.url, path), **self._prepare_json(kwargs))
        
         
         try:
-            return response.json()['data']
-        except Exception as e:
+            return _json_loads(response)['data']
+        except (ValueError, KeyError) as e:
             return {'error': f'No data found for this request : {e}'}
 
     def delete(self, path, **kwargs):
@@ -226,11 +456,13 @@ class DirectusClient:
             path (str): The API endpoint path.
             **kwargs: Additional keyword arguments to pass to the request.
         """
-        response = requests.delete(
+        self._ensure_auth()
+        # session.request instead of session.delete: httpx's delete() takes
+        # no body kwargs, and batched deletes always send a json id list
+        response = self.session.request(
+            "DELETE",
             self.clean_url(self.url, path),
-            headers={"Authorization": f"Bearer {self.get_token()}"},
-            verify=self.verify,
-            **kwargs
+            **self._prepare_json(kwargs)
         )
         if response.status_code != 204:
             raise AssertionError(response.text)
@@ -246,17 +478,16 @@ class DirectusClient:
         Returns:
             dict: The response data.
         """
-        response = requests.patch(
+        self._ensure_auth()
+        response = self.session.patch(
             self.clean_url(self.url, path),
-            headers={"Authorization": f"Bearer {self.get_token()}"},
-            verify=self.verify,
-            **kwargs
+            **self._prepare_json(kwargs)
         )
 
         if response.status_code not in [200, 204]:
             raise AssertionError(response.text)
 
-        return response.json()
+        return _json_loads(response)
 
     def me(self):
         """
@@ -341,13 +572,43 @@ class DirectusClient:
         Returns:
             str or bytes: The file content.
         """
+        self._ensure_auth()
         url = f"{self.url}/files/{file_id}"
-        headers = {"Authorization": f"Bearer {self.get_token()}"}
-        response = requests.get(url, headers=headers, verify=self.verify, **kwargs)
+        response = self.session.get(url, **kwargs)
         if response.status_code != 200:
             raise AssertionError(response.text)
         return response.content
 
+    def retrieve_file_stream(self, file_id: str, chunk_size: int = 1 << 20, **kwargs):
+        """
+        Stream a file's asset content chunk by chunk.
+
+        Unlike retrieve_file/download_file this never buffers the whole
+        asset: memory stays at chunk_size however large the file is.
+
+        Args:
+            file_id (str): The file ID.
+            chunk_size (int): Bytes per yielded chunk (default: 1 MiB).
+            **kwargs: Additional keyword arguments to pass to the request.
+
+        Yields:
+            bytes: The file content.
+        """
+        self._ensure_auth()
+        url = f"{self.url}/assets/{file_id}"
+        if self.http2:
+            with self.session.stream("GET", url, **kwargs) as response:
+                if response.status_code != 200:
+                    response.read()
+                    raise AssertionError(response.text)
+                yield from response.iter_bytes(chunk_size)
+            return
+
+        with self.session.get(url, stream=True, **kwargs) as response:
+            if response.status_code != 200:
+                raise AssertionError(response.text)
+            yield from response.iter_content(chunk_size)
+
     def download_file(self, file_id: str, file_path: str) -> None:
         """
         Just download a directus file in local
@@ -356,14 +617,7 @@ class DirectusClient:
             file_path (str): The path to save the file on your computer / server.
         """
         url = f"{self.url}/assets/{file_id}?download="
-        headers = {"Authorization": f"Bearer {self.get_token()}"}
-        response = requests.get(url, headers=headers)
-    
-        
-        if response.status_code != 200:
-            raise AssertionError(response.text)
-        with open(file_path, "wb") as file:
-            file.write(response.content)
+        self._stream_to_file(url, file_path)
     
     def download_photo(self, file_id: str, file_path: str, display: dict = {}, transform: list = []) -> None:
         """
@@ -393,15 +647,10 @@ class DirectusClient:
         """
 
         if len(transform) > 0:
-            display["transforms"] = json.dumps(transform)
+            display["transforms"] = json.dumps(transform, separators=(",", ":"))
 
         url = f"{self.url}/assets/{file_id}?download="
-        headers = {"Authorization": f"Bearer {self.get_token()}"}
-        response = requests.get(url, headers=headers, params=display, verify=self.verify)
-        if response.status_code != 200:
-            raise AssertionError(response.text)
-        with open(file_path, "wb") as file:
-            file.write(response.content)
+        self._stream_to_file(url, file_path, params=display)
 
     def get_url_file(self, file_id: str, display: dict = {}, transform: list = []) -> Union[str, bytes]:
         """
@@ -419,12 +668,11 @@ class DirectusClient:
         # If there are display parameters
         if transform:
             # transformer en json
-            display["transforms"] = json.dumps(transform)
+            display["transforms"] = json.dumps(transform, separators=(",", ":"))
 
         # Add parameters to the URL
         if display:
-            url += "?"
-            url += "&".join([f"{key}={value}" for key, value in display.items()])
+            url += "?" + urlencode(display, doseq=True)
 
         return url
     
@@ -434,24 +682,8 @@ class DirectusClient:
         """
         Define the file type based on the file extension.
         """
-        ext_file = file_path.split(".")[-1]
-        if ext_file in ["jpg", "jpg"]:
-            return "image/jpeg"
-        elif ext_file in ["png", "webp", "gif"]:
-            return f"image/{ext_file}"
-        elif ext_file == "pdf":
-            return "application/pdf"
-        elif ext_file in ["doc", "docx"]:
-            return "application/msword"
-        elif ext_file in ["xls", "xlsx"]:
-            return "application/vnd.ms-excel"
-        elif ext_file == "odt":
-            return "application/vnd.oasis.opendocument.text"
-        elif ext_file == "ods":
-            return "application/vnd.oasis.opendocument.spreadsheet"
-        else:
-            return "text/plain"
-         #jpg, png, pdf, etc...
+        ext_file = os.path.splitext(file_path)[1].lstrip(".").lower()
+        return _MIME_BY_EXT.get(ext_file, "text/plain")
     
     def upload_file(self, file_path: str, data: dict = {}) -> Dict:
         """
@@ -464,27 +696,43 @@ class DirectusClient:
         Returns:
             dict: The uploaded file data.
         """
+        self._ensure_auth()
         url = f"{self.url}/files"
-        headers = {"Authorization": f"Bearer {self.get_token()}"}
+        file_type = self.define_file_type(file_path)
+        # Scalar metadata rides in the multipart request itself; lists and
+        # nested dicts would arrive as Python reprs through form encoding,
+        # so those go in a follow-up JSON PATCH
+        data = {**data, "type": file_type}
+        simple = {}
+        nested = {}
+        for key, value in data.items():
+            # Form fields can only carry strings and numbers faithfully;
+            # bools must arrive as JSON true/false, None clears a field,
+            # and lists/dicts would be stringified — all go via PATCH
+            if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+                simple[key] = value
+            else:
+                nested[key] = value
         with open(file_path, 'rb') as file:
-            files = {'file': file}
-    
-            response = requests.post(url, headers=headers, files=files, verify=self.verify)
+            if MultipartEncoder is not None and not self.http2:
+                # Stream the multipart body: memory stays O(chunk) instead
+                # of the whole file being buffered for encoding
+                encoder = MultipartEncoder(fields={
+                    **{key: str(value) for key, value in simple.items()},
+                    'file': (os.path.basename(file_path), file, file_type),
+                })
+                response = self.session.post(url, data=encoder,
+                                             headers={'Content-Type': encoder.content_type})
+            else:
+                files = {'file': (os.path.basename(file_path), file, file_type)}
+                response = self.session.post(url, files=files, data=simple)
         if response.status_code != 200:
             raise AssertionError(response.text)
 
-        r = response.json()['data']
-        # Mettre à jour les métadonnées du fichier
-        data["type"] = self.define_file_type(file_path)
-        if data and response.json()['data']:
-            file_id = response.json()['data']['id']
-            # Mettre à jour le type du fichier
-            
-            
-            r = self.patch(f"/files/{file_id}", json=data)
-            r = r['data']
-
-        return r
+        payload = _json_loads(response)['data']
+        if nested:
+            payload = self.patch(f"/files/{payload['id']}", json=nested)['data']
+        return payload
 
     def delete_file(self, file_id, **kwargs):
         """
@@ -521,7 +769,39 @@ class DirectusClient:
         Returns:
             list: The list of items matching the query.
         """
-        return self.search(f"/items/{collection_name}", query=query, **kwargs)
+        return self.search(self._items_url(collection_name), query=query, **kwargs)
+
+    def iter_items(self, collection_name, query: Dict = None, page_size: int = 1000):
+        """
+        Iterate over items of a collection one page at a time.
+
+        Unlike get_items with limit=-1, this never materializes the whole
+        collection: pages of page_size items are fetched lazily.
+
+        Args:
+            collection_name (str): The collection name.
+            query (dict): The search query parameters (optional).
+            page_size (int): The number of items to fetch per request (default: 1000).
+
+        Yields:
+            dict: The items matching the query.
+        """
+        offset = 0
+        while True:
+            page_query = dict(query) if query else {}
+            inner = dict(page_query.get("query") or {})
+            inner["limit"] = page_size
+            inner["offset"] = offset
+            page_query["query"] = inner
+            page = self.search(self._items_url(collection_name), query=page_query)
+            if not isinstance(page, list):
+                # search() returns an error dict on failure; ending the
+                # iteration here would look like an exhausted collection
+                raise AssertionError(page)
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
 
     def get_item(self, collection_name, item_id, query: Dict = None, **kwargs):
         """
@@ -536,7 +816,7 @@ class DirectusClient:
         Returns:
             dict: The item matching the query.
         """
-        return self.get(f"/items/{collection_name}/{item_id}", **kwargs)
+        return self.get(self._items_url(collection_name) + "/" + str(item_id), **kwargs)
 
     def create_item(self, collection_name, item_data, **kwargs):
         """
@@ -550,7 +830,7 @@ class DirectusClient:
         Returns:
             dict: The created item.
         """
-        return self.post(f"/items/{collection_name}", json=item_data, **kwargs)
+        return self.post(self._items_url(collection_name), json=item_data, **kwargs)
 
     def update_item(self, collection_name, item_id, item_data, **kwargs):
         """
@@ -565,7 +845,7 @@ class DirectusClient:
         Returns:
             dict: The updated item.
         """
-        return self.patch(f"/items/{collection_name}/{item_id}", json=item_data, **kwargs)
+        return self.patch(self._items_url(collection_name) + "/" + str(item_id), json=item_data, **kwargs)
 
     def update_file(self, item_id, item_data, **kwargs):
         """
@@ -591,23 +871,43 @@ class DirectusClient:
             item_id (str): The item ID.
             **kwargs: Additional keyword arguments to pass to the request.
         """
-        self.delete(f"/items/{collection_name}/{item_id}", **kwargs)
+        self.delete(self._items_url(collection_name) + "/" + str(item_id), **kwargs)
 
-    def bulk_insert(self, collection_name: str, items: list, interval: int = 100, verbose: bool = False) -> None:
+    def bulk_insert(self, collection_name: str, items: list, interval: int = 100, verbose: bool = False,
+                    max_workers: int = 8) -> None:
         """
         Insert multiple items into a collection in bulk.
 
+        Chunks are posted concurrently over the pooled session, so wall time
+        drops roughly with the worker count on latency-bound links.
+
         Args:
             collection_name (str): The collection name.
             items (list): The list of items to insert.
             interval (int): The number of items to insert per request (default: 100).
             verbose (bool): Whether to print progress information (default: False).
+            max_workers (int): The number of concurrent requests (default: 8). Use 1 to insert serially.
         """
         length = len(items)
-        for i in range(0, length, interval):
-            if verbose:
-                print(f"Inserting {i}-{min(i + interval, length)} out of {length}")
-            self.post(f"/items/{collection_name}", json=items[i:i + interval])
+        chunks = [items[i:i + interval] for i in range(0, length, interval)]
+
+        if max_workers <= 1 or len(chunks) <= 1:
+            for i, chunk in zip(range(0, length, interval), chunks):
+                if verbose:
+                    print(f"Inserting {i}-{min(i + interval, length)} out of {length}")
+                self.post(self._items_url(collection_name), json=chunk)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.post, self._items_url(collection_name), json=chunk): i
+                for i, chunk in zip(range(0, length, interval), chunks)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                future.result()
+                if verbose:
+                    print(f"Inserted {i}-{min(i + interval, length)} out of {length}")
 
     def duplicate_collection(self, collection_name: str, duplicate_collection_name: str) -> None:
         """
@@ -617,18 +917,40 @@ class DirectusClient:
             collection_name (str): The name of the collection to duplicate.
             duplicate_collection_name (str): The name of the duplicated collection.
         """
-        duplicate_collection = self.get(f"/collections/{collection_name}")
-        duplicate_collection['collection'] = duplicate_collection_name
-        duplicate_collection['meta']['collection'] = duplicate_collection_name
-        duplicate_collection['schema']['name'] = duplicate_collection_name
-        self.post("/collections", json=duplicate_collection)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # The field list is independent of the collection POST, so fetch
+            # it while the new collection is being created
+            fields_future = executor.submit(self.get_all_fields, collection_name)
 
-        fields = [field for field in self.get_all_fields(collection_name) if not field['schema']['is_primary_key']]
-        for field in fields:
-            self.post(f"/fields/{duplicate_collection_name}", json=field)
+            duplicate_collection = self.get(f"/collections/{collection_name}")
+            duplicate_collection['collection'] = duplicate_collection_name
+            duplicate_collection['meta']['collection'] = duplicate_collection_name
+            duplicate_collection['schema']['name'] = duplicate_collection_name
+            self.post("/collections", json=duplicate_collection)
+            self._schema_cache.pop(f"pk:{duplicate_collection_name}", None)
+            self._schema_cache.pop(f"exists:{duplicate_collection_name}", None)
+
+            fields = [field for field in fields_future.result() if not field['schema']['is_primary_key']]
 
-        items = self.get(f"/items/{collection_name}", params={"limit": -1})
-        self.bulk_insert(duplicate_collection_name, items)
+        try:
+            # One POST with the whole field list: N-1 round-trips fewer than
+            # creating fields one by one
+            self.post(f"/fields/{duplicate_collection_name}", json=fields)
+        except AssertionError:
+            # Older servers only accept one field per request
+            for field in fields:
+                self.post(f"/fields/{duplicate_collection_name}", json=field)
+
+        # Stream items page by page instead of loading the whole collection
+        # with limit=-1 before the first insert
+        batch = []
+        for item in self.iter_items(collection_name):
+            batch.append(item)
+            if len(batch) == 100:
+                self.post(self._items_url(duplicate_collection_name), json=batch)
+                batch = []
+        if batch:
+            self.post(self._items_url(duplicate_collection_name), json=batch)
 
     def collection_exists(self, collection_name: str) -> bool:
         """
@@ -640,23 +962,51 @@ class DirectusClient:
         Returns:
             bool: True if the collection exists, False otherwise.
         """
-        collection_schema = [col['collection'] for col in self.get('/collections')]
-        return collection_name in collection_schema
-
-    def delete_all_items(self, collection_name: str) -> None:
+        key = f"exists:{collection_name}"
+        entry = self._schema_cache.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return True
+
+        self._ensure_auth()
+        response = self.session.get(self.clean_url(self.url, f"/collections/{collection_name}"))
+        if response.status_code == 200:
+            # Only existence is memoized: a cached False would hide a
+            # collection created right after the check for a whole TTL
+            self._schema_cache[key] = (time.monotonic() + self._SCHEMA_TTL, True)
+            return True
+        if response.status_code in (403, 404):
+            # Directus answers 403 for unknown collections when the
+            # token lacks read access to the collections listing
+            return False
+        # Transient failures (expired auth, gateway errors) must not read
+        # as a missing collection
+        raise AssertionError(response.text)
+
+    def delete_all_items(self, collection_name: str, page_size: int = 10000) -> None:
         """
         Delete all items from a collection.
 
+        Ids are fetched one page at a time instead of loading the whole
+        collection with limit=-1, so peak memory stays at page_size.
+
         Args:
             collection_name (str): The collection name.
+            page_size (int): The number of ids to fetch per request (default: 10000).
         """
         pk_name = self.get_pk_field(collection_name)['field']
-        item_ids = [data['id'] for data in self.get(f"/items/{collection_name}?fields={pk_name}", params={"limit": -1})]
-        if not item_ids:
-            raise AssertionError("No items to delete!")
+        deleted_any = False
+        while True:
+            # Always re-fetch from the start: deleting shifts offset-based pages
+            page = self.get(self._items_url(collection_name) + f"?fields={pk_name}", params={"limit": page_size})
+            item_ids = [data[pk_name] for data in page]
+            if not item_ids:
+                break
+            deleted_any = True
+            for i in range(0, len(item_ids), 100):
+                self.delete(self._items_url(collection_name), json=item_ids[i:i + 100])
 
-        for i in range(0, len(item_ids), 100):
-            self.delete(f"/items/{collection_name}", json=item_ids[i:i + 100])
+        if not deleted_any:
+            raise AssertionError("No items to delete!")
 
     def get_all_fields(self, collection_name: str, query: Dict = None, **kwargs) -> list:
         """
@@ -672,8 +1022,10 @@ class DirectusClient:
         """
         fields = self.search(f"/fields/{collection_name}", query=query, **kwargs)
         for field in fields:
-            if field.get('meta') and field['meta'].get('id'):
-                field['meta'].pop('id')
+            # Single lookup and unconditional pop instead of get + get + pop
+            meta = field.get('meta')
+            if meta:
+                meta.pop('id', None)
 
         return fields
 
@@ -687,7 +1039,10 @@ class DirectusClient:
         Returns:
             dict: The primary key field.
         """
-        return next(field for field in self.get(f"/fields/{collection_name}") if field['schema']['is_primary_key'])
+        return self._schema_cached(
+            f"pk:{collection_name}",
+            lambda: next(field for field in self.get(f"/fields/{collection_name}")
+                         if field['schema']['is_primary_key']))
 
     def get_all_user_created_collection_names(self, query: Dict = None, **kwargs) -> list:
         """
@@ -745,27 +1100,27 @@ class DirectusClient:
             relation (dict): The relation data.
         """
         assert set(relation.keys()) == {'collection', 'field', 'related_collection'}
-        try:
-            self.post(f"/relations", json=relation)
-        except AssertionError as e:
-            if '"id" has to be unique' in str(e):
-                self.post_relation(relation)
-            else:
-                raise
+        for attempt in range(8):
+            try:
+                return self.post(f"/relations", json=relation)
+            except AssertionError as e:
+                if '"id" has to be unique' not in str(e):
+                    raise
+                time.sleep(0.05 * (2 ** attempt))
+        raise AssertionError(f"post_relation: giving up after 8 attempts on {relation}")
     
     def search_query(self, query: str, exclude_worlds_len: int = 2, cut_words: bool = True, **kwargs):
-        q = []
         if cut_words:
-            q = [word for word in query.split() if len(word) > exclude_worlds_len]
+            threshold = exclude_worlds_len
+            q = [word for word in query.split() if len(word) > threshold]
         else:
             q = [query]
-            
-        query = {
+
+        return {
             "query": {
                 "search": q
             }
         }
-        return query
         
         
 @dataclass
@@ -800,19 +1155,23 @@ class DirectusQueryBuilder:
         """
         if "filter" not in self.query["query"]:
             self.query["query"]["filter"] = {}
-            
-        # If we already have conditions, wrap everything in a new logical operator
-        if self.query["query"]["filter"]:
-            current_filter = self.query["query"]["filter"].copy()
+
+        current_filter = self.query["query"]["filter"]
+        if not current_filter:
+            current_filter[logic_op] = list(conditions)
+        elif len(current_filter) == 1 and isinstance(current_filter.get(logic_op), list):
+            # Same logical operator at the root: extend in place instead of
+            # copying and re-wrapping, which nested linearly per call
+            current_filter[logic_op].extend(conditions)
+        else:
+            # Different operator: wrap the existing filter in the new one
             self.query["query"]["filter"] = {
                 logic_op: [
                     current_filter,
                     *conditions
                 ]
             }
-        else:
-            self.query["query"]["filter"][logic_op] = conditions
-            
+
         return self
     
     def or_condition(self, conditions: List[Dict]) -> 'DirectusQueryBuilder':
@@ -862,270 +1221,11 @@ class DirectusQueryBuilder:
         """Build and return the final query"""
         return self.query
 
-class SQLToDirectusConverter:
-    def __init__(self):
-        self.builder = DirectusQueryBuilder()
-
-    def _format_sql(self, sql: str) -> str:
-        """Format SQL query before parsing"""
-        # Add spaces around parentheses
-        sql = sql.replace("(", " ( ")
-        sql = sql.replace(")", " ) ")
-        # Remove multiple spaces
-        sql = " ".join(sql.split())
-        return sql
-
-    def _get_next_value_after_keyword(self, tokens: List[Token], keyword: str) -> Optional[str]:
-        """Helper to get the next value after a keyword"""
-        for i, token in enumerate(tokens):
-            if token.ttype is Keyword and token.value.upper() == keyword:
-                # Look for the next non-whitespace token
-                for next_token in tokens[i+1:]:
-                    if not next_token.is_whitespace:
-                        return str(next_token)
-        return None
-
-    def _get_order_by_fields(self, tokens: List[Token]) -> List[str]:
-        """
-        Extrait les champs ORDER BY de la requête SQL
-        Retourne une liste de champs avec '-' pour DESC
-        """
-        order_fields = []
-        in_order_by = False
-        
-        for token in tokens:
-            if token.ttype is Keyword and token.value.upper() == "ORDER BY":
-                in_order_by = True
-                continue
-                    
-            if in_order_by:
-                if token.ttype is Keyword and token.value.upper() in ("LIMIT", "OFFSET"):
-                    break
-                    
-                if not token.is_whitespace and token.value != ',':
-                    value = str(token).strip()
-                    if value.upper() == "ASC":
-                        continue
-                    elif value.upper() == "DESC":
-                        if order_fields:  # S'assurer qu'il y a un champ précédent
-                            order_fields[-1] = f"-{order_fields[-1]}"  # Ajouter le - au champ précédent
-                    else:
-                        order_fields.append(value)
-                    
-        return order_fields
-    
-    @staticmethod
-    def _get_operator_mapping(sql_operator: str) -> str:
-        """Map SQL operators to Directus operators"""
-        mapping = {
-            "=": DOp.EQUALS,
-            "!=": DOp.NOT_EQUALS,
-            "<": DOp.LESS_THAN,
-            "<=": DOp.LESS_THAN_EQUAL,
-            ">": DOp.GREATER_THAN,
-            ">=": DOp.GREATER_THAN_EQUAL,
-            "IN": DOp.IN,
-            "NOT IN": DOp.NOT_IN,
-            "IS NULL": DOp.NULL,
-            "IS NOT NULL": DOp.NOT_NULL,
-            "LIKE": DOp.CONTAINS,
-        }
-        return mapping.get(sql_operator.upper(), sql_operator)
-
-    def _parse_comparison(self, comparison: Comparison) -> Dict:
-        """Parse a SQL comparison into a Directus filter condition"""
-        left = str(comparison.left)
-        operator = None
-        right_value = None
-
-        # Parcourir les tokens pour trouver l'opérateur et la valeur
-        for token in comparison.tokens:
-            if token.is_whitespace:
-                continue
-            if token.ttype is sqlparse.tokens.Keyword:
-                operator = self._get_operator_mapping(token.value)
-            elif isinstance(token, sqlparse.sql.Parenthesis):
-                # Cas spécial pour IN
-                values = str(token).strip("()").split(",")
-                right_value = [v.strip(" '\"") for v in values]
-            elif token.ttype is sqlparse.tokens.Name.Mixed or token.ttype is sqlparse.tokens.String.Single:
-                if right_value is None:  # Ne pas écraser la valeur si déjà définie (cas IN)
-                    right_value = str(token).strip("'\"")
-
-        if operator is None:
-            # Cas où l'opérateur n'est pas un keyword (e.g., =, !=, etc.)
-            operator = self._get_operator_mapping(str(comparison.token_next(0)[1]))
-
-        return {left: {operator: right_value}}
-
-    def _parse_group(self, group_token) -> Dict:
-        """Parse a grouped condition token (conditions within parentheses) recursively"""
-        # Remove outer parentheses and parse as a separate SQL statement
-        group_sql = str(group_token).strip("()")
-        if not group_sql.strip():
-            return {}
-            
-        parsed_group = sqlparse.parse(group_sql)[0]
-        
-        conditions = []
-        current_operator = "_and"
-        
-        # Pour gérer les IN on doit regrouper les tokens
-        tokens = [token for token in parsed_group.tokens if not token.is_whitespace]
-        i = 0
-        while i < len(tokens):
-            token = tokens[i]
-            
-            if token.ttype is Keyword:
-                if token.value.upper() == "OR":
-                    current_operator = "_or"
-                elif token.value.upper() == "AND":
-                    current_operator = "_and"
-                i += 1
-                continue
-                
-            # Détecter si c'est un IN
-            if (i + 2) < len(tokens) and tokens[i+1].value.upper() == 'IN':
-                # Créer une comparaison artificielle avec les 3 tokens
-                comparison = Comparison([tokens[i], tokens[i+1], tokens[i+2]])
-                cond = self._parse_comparison(comparison)
-                if cond:
-                    conditions.append(cond)
-                i += 3  # On avance de 3 tokens
-                continue
-                
-            if isinstance(token, Comparison):
-                cond = self._parse_comparison(token)
-                if cond:  # Ne pas ajouter les dictionnaires vides
-                    conditions.append(cond)
-            elif str(token).strip().startswith("("):
-                # Parsing récursif pour les sous-groupes
-                sub_conditions = self._parse_group(token)
-                if sub_conditions:  # Ne pas ajouter les dictionnaires vides
-                    conditions.append(sub_conditions)
-            elif isinstance(token, sqlparse.sql.Parenthesis):
-                if str(token).strip():  # Vérifier que ce n'est pas vide
-                    sub_conditions = self._parse_group(token)
-                    if sub_conditions:  # Ne pas ajouter les dictionnaires vides
-                        conditions.append(sub_conditions)
-            else:
-                # Pour les tokens complexes, les redécouper
-                sub_conditions = self._parse_non_standard_token(token)
-                conditions.extend(sub_conditions)
-                
-            i += 1
-        
-        if not conditions:
-            return {}
-        if len(conditions) == 1:
-            return conditions[0]
-            
-        return {current_operator: conditions}
 
-    def _parse_non_standard_token(self, token) -> List[Dict]:
-        """Parse a non-standard token by re-parsing it as SQL"""
-        conditions = []
-        try:
-            sub_tokens = [t for t in sqlparse.parse(str(token))[0].tokens if not t.is_whitespace]
-            i = 0
-            while i < len(sub_tokens):
-                sub_token = sub_tokens[i]
-                
-                # Détecter si c'est un IN
-                if (i + 2) < len(sub_tokens) and sub_tokens[i+1].value.upper() == 'IN':
-                    # Créer une comparaison artificielle avec les 3 tokens
-                    comparison = Comparison([sub_tokens[i], sub_tokens[i+1], sub_tokens[i+2]])
-                    parsed_condition = self._parse_comparison(comparison)
-                    if parsed_condition:
-                        conditions.append(parsed_condition)
-                    i += 3  # On avance de 3 tokens
-                    continue
-                    
-                if isinstance(sub_token, Comparison):
-                    parsed_condition = self._parse_comparison(sub_token)
-                    if parsed_condition:
-                        conditions.append(parsed_condition)
-                i += 1
-        except Exception as e:
-            print(f"Error in _parse_non_standard_token: {e}")
-        return conditions
-
-    def _parse_where_conditions(self, where_clause: Where) -> List[Dict]:
-        """Parse WHERE clause conditions with support for groups"""
-        conditions = []
-        current_group = []
-        current_operator = "_and"
-        
-        for token in where_clause.tokens:
-            if token.is_whitespace:
-                continue
-                
-            if token.ttype is Keyword and token.value.upper() in ("AND", "OR"):
-                if token.value.upper() == "OR":
-                    current_operator = "_or"
-                continue
-            
-            if isinstance(token, Comparison):
-                cond = self._parse_comparison(token)
-                if cond:
-                    conditions.append(cond)
-            elif str(token).strip().startswith("("):
-                group_conditions = self._parse_group(token)
-                if group_conditions:
-                    conditions.append(group_conditions)
-            else:
-                # Essayer de parser comme un token complexe
-                sub_conditions = self._parse_non_standard_token(token)
-                conditions.extend(sub_conditions)
-        
-        if current_operator == "_or":
-            return [{"_or": conditions}]
-        return conditions
-
-    def convert(self, sql_query: str) -> Dict:
-        """Convert a SQL query to a Directus query"""
-        # Format SQL before parsing
-        sql_query = self._format_sql(sql_query)
-        
-        parsed = sqlparse.parse(sql_query)[0]
-        tokens = list(parsed.flatten())
-        
-        where_clause = None
-        limit_value = None
-        offset_value = None
-        
-        # Find WHERE clause
-        for token in parsed.tokens:
-            if isinstance(token, Where):
-                where_clause = token
-                break
-        
-        # Get LIMIT and OFFSET values
-        limit_str = self._get_next_value_after_keyword(tokens, "LIMIT")
-        offset_str = self._get_next_value_after_keyword(tokens, "OFFSET")
-        
-        if limit_str and limit_str.isdigit():
-            limit_value = int(limit_str)
-        if offset_str and offset_str.isdigit():
-            offset_value = int(offset_str)
-        
-        # Build the query using DirectusQueryBuilder
-        builder = DirectusQueryBuilder()
-        
-        # Add WHERE conditions if present
-        if where_clause:
-            conditions = self._parse_where_conditions(where_clause)
-            builder.and_condition(conditions)
-        
-        # Add ORDER BY if present
-        order_fields = self._get_order_by_fields(tokens)
-        if order_fields:
-            builder.sort(*order_fields)
-        
-        # Add limit and offset if present
-        if limit_value is not None:
-            builder.limit(limit_value)
-        if offset_value is not None:
-            builder.offset(offset_value)
-            
-        return builder.build()
\ No newline at end of file
+def __getattr__(name):
+    # Lazy re-export so "from directus_sdk_py.main import SQLToDirectusConverter"
+    # keeps working without importing sqlparse at package import time
+    if name == "SQLToDirectusConverter":
+        from .sql_converter import SQLToDirectusConverter
+        return SQLToDirectusConverter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
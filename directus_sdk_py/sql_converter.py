@@ -0,0 +1,656 @@
+"""
+SQL to Directus query conversion.
+
+Kept in its own module so that importing the package (and DirectusClient)
+does not pay the sqlparse import cost; sqlparse only loads when the
+converter is actually used.
+"""
+
+from __future__ import annotations
+
+import copy
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import sqlparse
+from sqlparse.sql import Where, Comparison, Token
+from sqlparse.tokens import Keyword, Whitespace
+
+from .main import DOp, DirectusQueryBuilder
+
+
+class _FastParseError(Exception):
+    """Raised when the fast parser meets SQL outside the supported subset"""
+
+
+# DOp constants resolved once at import: the parsers then reach them as
+# module globals instead of attribute loads per comparison
+_IN = DOp.IN
+_NOT_IN = DOp.NOT_IN
+_CONTAINS = DOp.CONTAINS
+_BETWEEN = DOp.BETWEEN
+_NULL = DOp.NULL
+_NOT_NULL = DOp.NOT_NULL
+
+# Symbolic comparison operators: case-insensitivity does not apply, so these
+# are looked up without the .upper() allocation
+_SQL_TO_DOP = {
+    "=": DOp.EQUALS,
+    "!=": DOp.NOT_EQUALS,
+    "<": DOp.LESS_THAN,
+    "<=": DOp.LESS_THAN_EQUAL,
+    ">": DOp.GREATER_THAN,
+    ">=": DOp.GREATER_THAN_EQUAL,
+}
+
+# Word-form operators, keyed by their uppercase spelling
+_SQL_WORD_TO_DOP = {
+    "IN": _IN,
+    "NOT IN": _NOT_IN,
+    "IS NULL": _NULL,
+    "IS NOT NULL": _NOT_NULL,
+    "LIKE": _CONTAINS,
+}
+
+
+@lru_cache(maxsize=1024)
+def _upper(s: str) -> str:
+    """Memoized str.upper: keyword tokens repeat, so each spelling allocates once"""
+    return s.upper()
+
+
+# Spaces out parentheses and collapses whitespace runs in one substitution
+_FORMAT_RE = re.compile(r"\s*([()])\s*|\s+")
+
+
+# Pulls the values out of an IN (...) list in one findall, quotes and
+# padding stripped by the pattern itself
+_IN_VAL_RE = re.compile(r"[\s('\"]*([^,)'\"]+?)[\s)'\"]*(?:,|$)")
+
+
+# Quick membership test for the clauses the converter can translate; a
+# query without any of them converts to an empty Directus query
+_HAS_CLAUSE_RE = re.compile(r"\b(WHERE|ORDER\s+BY|LIMIT|OFFSET)\b", re.I)
+
+
+# Single-pass lexer for the SQL subset the converter supports; anything it
+# cannot tokenize falls back to sqlparse
+_TOKEN_RE = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<str>'[^']*'|"[^"]*")
+  | (?P<num>\d+(?:\.\d+)?)
+  | (?P<op><=|>=|!=|<>|=|<|>)
+  | (?P<punct>[(),*])
+  | (?P<word>[A-Za-z_][\w.]*)
+""", re.X)
+
+
+def _tokenize(sql: str) -> List[Tuple[str, str]]:
+    """Tokenize SQL into (kind, value) pairs, raising on unsupported input"""
+    tokens = []
+    append = tokens.append
+    pos = 0
+    for match in _TOKEN_RE.finditer(sql):
+        if match.start() != pos:
+            raise _FastParseError(f"unsupported character at {pos}")
+        pos = match.end()
+        kind = match.lastgroup
+        if kind != "ws":
+            append((kind, match.group()))
+    if pos != len(sql):
+        raise _FastParseError(f"unsupported character at {pos}")
+    return tokens
+
+
+class _FastParser:
+    """
+    Recursive-descent parser for WHERE / ORDER BY / LIMIT / OFFSET.
+
+    Tokenizes once and emits Directus filter dicts directly, so parsing
+    stays linear even on large IN (...) lists.
+    """
+
+    def __init__(self, tokens: List[Tuple[str, str]]) -> None:
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self) -> Optional[Tuple[str, str]]:
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return None
+
+    def next(self) -> Tuple[str, str]:
+        token = self.peek()
+        if token is None:
+            raise _FastParseError("unexpected end of input")
+        self.pos += 1
+        return token
+
+    def peek_word(self) -> Optional[str]:
+        token = self.peek()
+        if token is not None and token[0] == "word":
+            return token[1].upper()
+        return None
+
+    def expect_punct(self, value: str) -> None:
+        token = self.next()
+        if token != ("punct", value):
+            raise _FastParseError(f"expected {value!r}, got {token[1]!r}")
+
+    def parse_value(self) -> object:
+        kind, value = self.next()
+        if kind == "str":
+            return value[1:-1]
+        if kind == "num":
+            return float(value) if "." in value else int(value)
+        if kind == "word":
+            return value
+        raise _FastParseError(f"expected a value, got {value!r}")
+
+    def parse_value_list(self) -> List[object]:
+        self.expect_punct("(")
+        values = [self.parse_value()]
+        while self.peek() == ("punct", ","):
+            self.next()
+            values.append(self.parse_value())
+        self.expect_punct(")")
+        return values
+
+    def parse_term(self) -> Dict:
+        token = self.peek()
+        if token == ("punct", "("):
+            self.next()
+            conditions, logic_op = self.parse_expr()
+            self.expect_punct(")")
+            if len(conditions) == 1:
+                return conditions[0]
+            return {logic_op: conditions}
+
+        kind, field = self.next()
+        if kind != "word":
+            raise _FastParseError(f"expected a field name, got {field!r}")
+
+        kind, value = self.next()
+        if kind == "op":
+            operator = _SQL_TO_DOP["!=" if value == "<>" else value]
+            return {field: {operator: self.parse_value()}}
+        if kind != "word":
+            raise _FastParseError(f"expected an operator, got {value!r}")
+
+        word = value.upper()
+        if word == "IN":
+            return {field: {_IN: self.parse_value_list()}}
+        if word == "NOT" and self.peek_word() == "IN":
+            self.next()
+            return {field: {_NOT_IN: self.parse_value_list()}}
+        if word == "LIKE":
+            return {field: {_CONTAINS: self.parse_value()}}
+        if word == "BETWEEN":
+            low = self.parse_value()
+            if self.peek_word() != "AND":
+                raise _FastParseError("expected AND in BETWEEN")
+            self.next()
+            return {field: {_BETWEEN: [low, self.parse_value()]}}
+        if word == "IS":
+            negated = self.peek_word() == "NOT"
+            if negated:
+                self.next()
+            if self.peek_word() != "NULL":
+                raise _FastParseError("expected NULL after IS")
+            self.next()
+            return {field: {_NOT_NULL if negated else _NULL: True}}
+        raise _FastParseError(f"unsupported operator {word!r}")
+
+    def parse_expr(self) -> Tuple[List[Dict], str]:
+        """Parse AND/OR chains, returning (conditions, logical operator)"""
+        conditions = [self.parse_term()]
+        append = conditions.append
+        logic_op = "_and"
+        while True:
+            word = self.peek_word()
+            if word == "AND":
+                self.next()
+            elif word == "OR":
+                self.next()
+                logic_op = "_or"
+            else:
+                return conditions, logic_op
+            append(self.parse_term())
+
+
+class SQLToDirectusConverter:
+    def __init__(self) -> None:
+        self.builder = DirectusQueryBuilder()
+
+    def _format_sql(self, sql: str) -> str:
+        """Format SQL query before parsing"""
+        # One regex pass instead of two replaces plus a split/join, which
+        # each copied the whole query string
+        return _FORMAT_RE.sub(lambda m: f" {m.group(1)} " if m.group(1) else " ", sql).strip()
+
+    @staticmethod
+    def _extract_tail(parsed) -> Tuple[List[str], Optional[int], Optional[int]]:
+        """
+        One lazy pass over parsed.flatten() collecting the ORDER BY fields
+        and the LIMIT / OFFSET values; the leaf tokens are consumed as a
+        stream instead of being materialized into a list first.
+        """
+        order_fields: List[str] = []
+        limit_value = None
+        offset_value = None
+        mode = None  # which tail clause the scan is currently inside
+        for token in parsed.flatten():
+            ttype = token.ttype
+            if ttype is Whitespace:
+                continue
+            if ttype is Keyword:
+                word = _upper(token.value)
+                if word == "ORDER BY":
+                    mode = "order"
+                    continue
+                if word == "LIMIT":
+                    mode = "limit"
+                    continue
+                if word == "OFFSET":
+                    mode = "offset"
+                    continue
+            if mode == "order":
+                value = token.value.strip()
+                if value == ",":
+                    continue
+                word = _upper(value)
+                if word == "ASC":
+                    continue
+                if word == "DESC":
+                    if order_fields:  # S'assurer qu'il y a un champ précédent
+                        order_fields[-1] = f"-{order_fields[-1]}"
+                else:
+                    order_fields.append(value)
+            elif mode == "limit":
+                if limit_value is None and token.value.isdigit():
+                    limit_value = int(token.value)
+                mode = None
+            elif mode == "offset":
+                if offset_value is None and token.value.isdigit():
+                    offset_value = int(token.value)
+                mode = None
+        return order_fields, limit_value, offset_value
+    
+    @staticmethod
+    def _get_operator_mapping(sql_operator: str) -> str:
+        """Map SQL operators to Directus operators"""
+        mapped = _SQL_TO_DOP.get(sql_operator)
+        if mapped is not None:
+            return mapped
+        return _SQL_WORD_TO_DOP.get(_upper(sql_operator), sql_operator)
+
+    def _parse_comparison(self, comparison: Comparison) -> Dict:
+        """Parse a SQL comparison into a Directus filter condition"""
+        # Common case: the three-token form 'identifier OP value', handled
+        # by direct indexing; only IN (...) needs the full token walk
+        toks = [t for t in comparison.tokens if t.ttype is not Whitespace]
+        if len(toks) == 3 and not isinstance(toks[2], sqlparse.sql.Parenthesis):
+            right = toks[2]
+            value = right.value.strip("'\"")
+            if right.ttype in sqlparse.tokens.Number:
+                value = float(value) if "." in value else int(value)
+            return {toks[0].value: {self._get_operator_mapping(toks[1].value): value}}
+
+        left = comparison.left.value
+        operator = None
+        right_value = None
+
+        # Parcourir les tokens pour trouver l'opérateur et la valeur
+        for token in comparison.tokens:
+            if token.ttype is Whitespace:
+                continue
+            if token.ttype is sqlparse.tokens.Keyword:
+                operator = self._get_operator_mapping(token.value)
+            elif isinstance(token, sqlparse.sql.Parenthesis):
+                # Cas spécial pour IN: une seule passe regex au lieu de
+                # strip/split puis strip par élément
+                values = _IN_VAL_RE.findall(token.value)
+                if values and all(v.isdigit() for v in values):
+                    values = [int(v) for v in values]
+                right_value = values
+            elif token.ttype is sqlparse.tokens.Name.Mixed or token.ttype is sqlparse.tokens.String.Single:
+                if right_value is None:  # Ne pas écraser la valeur si déjà définie (cas IN)
+                    right_value = token.value.strip("'\"")
+
+        if operator is None:
+            # Cas où l'opérateur n'est pas un keyword (e.g., =, !=, etc.)
+            operator = self._get_operator_mapping(comparison.token_next(0)[1].value)
+
+        return {left: {operator: right_value}}
+
+    @staticmethod
+    def _group_tokens(group_token: Token) -> Optional[List[Token]]:
+        """Inner tokens of a parenthesized group, whitespace dropped"""
+        if isinstance(group_token, sqlparse.sql.Parenthesis):
+            # Walk the tokens sqlparse already grouped; stringifying and
+            # re-parsing would re-run the whole tokenizer per nesting level
+            inner = group_token.tokens
+            if inner and inner[-1].value == ")":
+                inner = inner[1:-1]
+            else:
+                inner = inner[1:]
+            return [token for token in inner if token.ttype is not Whitespace]
+        # Remove outer parentheses and parse as a separate SQL statement
+        group_sql = group_token.value.strip("()")
+        if not group_sql.strip():
+            return None
+        parsed_group = sqlparse.parse(group_sql)[0]
+        return [token for token in parsed_group.tokens if token.ttype is not Whitespace]
+
+    def _parse_group(self, group_token: Token) -> Dict:
+        """
+        Parse a grouped condition token (conditions within parentheses).
+
+        Nesting is handled with an explicit frame stack rather than
+        recursion, so arbitrarily deep groups cost one list entry per
+        level instead of a Python frame, with no RecursionError risk.
+        """
+        tokens = self._group_tokens(group_token)
+        if tokens is None:
+            return {}
+
+        root: List[Dict] = []
+        # frame layout: [tokens, next index, conditions, logic op, parent conditions]
+        frames = [[tokens, 0, [], "_and", root]]
+
+        while frames:
+            frame = frames[-1]
+            tokens, i, conditions, current_operator, parent = frame
+
+            if i >= len(tokens):
+                # Group exhausted: fold it up and hand it to the parent
+                frames.pop()
+                if not conditions:
+                    continue
+                if len(conditions) == 1:
+                    parent.append(conditions[0])
+                else:
+                    parent.append({current_operator: conditions})
+                continue
+
+            token = tokens[i]
+            frame[1] = i + 1
+
+            if token.ttype is Keyword:
+                if _upper(token.value) == "OR":
+                    frame[3] = "_or"
+                elif _upper(token.value) == "AND":
+                    frame[3] = "_and"
+                continue
+
+            # Détecter si c'est un IN
+            if (i + 2) < len(tokens) and _upper(tokens[i+1].value) == 'IN':
+                # Créer une comparaison artificielle avec les 3 tokens
+                comparison = Comparison([tokens[i], tokens[i+1], tokens[i+2]])
+                cond = self._parse_comparison(comparison)
+                if cond:
+                    conditions.append(cond)
+                frame[1] = i + 3  # On avance de 3 tokens
+                continue
+
+            if type(token) is Comparison:
+                cond = self._parse_comparison(token)
+                if cond:
+                    conditions.append(cond)
+            elif isinstance(token, sqlparse.sql.Parenthesis) or token.value.lstrip().startswith("("):
+                # Sous-groupe: on empile un nouveau cadre
+                sub_tokens = self._group_tokens(token)
+                if sub_tokens is not None:
+                    frames.append([sub_tokens, 0, [], "_and", conditions])
+            else:
+                # Pour les tokens complexes, les redécouper
+                conditions.extend(self._parse_non_standard_token(token))
+
+        if not root:
+            return {}
+        return root[0]
+
+    def _handle_comparison(self, token: Comparison) -> List[Dict]:
+        """Dispatch target for Comparison tokens"""
+        cond = self._parse_comparison(token)
+        return [cond] if cond else []
+
+    def _handle_parenthesis(self, token: Token) -> List[Dict]:
+        """Dispatch target for Parenthesis tokens"""
+        group = self._parse_group(token)
+        return [group] if group else []
+
+    def _parse_non_standard_token(self, token: Token) -> List[Dict]:
+        """Parse a non-standard token by re-parsing it as SQL"""
+        conditions = []
+        append = conditions.append
+        try:
+            sub_tokens = [t for t in sqlparse.parse(token.value)[0].tokens if t.ttype is not Whitespace]
+            i = 0
+            while i < len(sub_tokens):
+                sub_token = sub_tokens[i]
+                
+                # Détecter si c'est un IN
+                if (i + 2) < len(sub_tokens) and _upper(sub_tokens[i+1].value) == 'IN':
+                    # Créer une comparaison artificielle avec les 3 tokens
+                    comparison = Comparison([sub_tokens[i], sub_tokens[i+1], sub_tokens[i+2]])
+                    parsed_condition = self._parse_comparison(comparison)
+                    if parsed_condition:
+                        append(parsed_condition)
+                    i += 3  # On avance de 3 tokens
+                    continue
+                    
+                if isinstance(sub_token, Comparison):
+                    parsed_condition = self._parse_comparison(sub_token)
+                    if parsed_condition:
+                        append(parsed_condition)
+                i += 1
+        except Exception as e:
+            print(f"Error in _parse_non_standard_token: {e}")
+        return conditions
+
+    def _parse_where_conditions(self, where_clause: Where) -> List[Dict]:
+        """Parse WHERE clause conditions with support for groups"""
+        conditions = []
+        append = conditions.append
+        extend = conditions.extend
+        current_group = []
+        current_operator = "_and"
+        
+        for token in where_clause.tokens:
+            if token.ttype is Whitespace:
+                continue
+                
+            if token.ttype is Keyword and _upper(token.value) in ("AND", "OR"):
+                if _upper(token.value) == "OR":
+                    current_operator = "_or"
+                continue
+            
+            handler = _TOKEN_HANDLERS.get(type(token))
+            if handler is not None:
+                extend(handler(self, token))
+            elif token.value.lstrip().startswith("("):
+                group_conditions = self._parse_group(token)
+                if group_conditions:
+                    append(group_conditions)
+            else:
+                # Essayer de parser comme un token complexe
+                sub_conditions = self._parse_non_standard_token(token)
+                extend(sub_conditions)
+        
+        if current_operator == "_or":
+            return [{"_or": conditions}]
+        return conditions
+
+    def convert(self, sql_query: str) -> Dict:
+        """
+        Convert a SQL query to a Directus query.
+
+        Results are memoized on the normalized SQL string, so repeated
+        parametric queries skip the sqlparse work entirely; a deep copy is
+        returned so callers may mutate the result freely.
+        """
+        # Nothing to translate without WHERE / ORDER BY / LIMIT / OFFSET:
+        # skip formatting, parsing and the builder allocation entirely.
+        # Fresh dicts, not a shared singleton, because callers may mutate
+        # the result
+        if not _HAS_CLAUSE_RE.search(sql_query):
+            return {"query": {}}
+        sql_query = self._format_sql(sql_query)
+        return copy.deepcopy(_convert_cached(sql_query))
+
+    def convert_batch(self, queries: List[str], max_workers: int = 8) -> List[Dict]:
+        """
+        Convert several SQL queries concurrently.
+
+        Args:
+            queries: SQL queries to convert
+            max_workers: Thread pool size; pass 1 to convert serially
+
+        Returns:
+            The Directus queries, in the same order as the input
+        """
+        if max_workers <= 1 or len(queries) <= 1:
+            return [self.convert(query) for query in queries]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.convert, queries))
+
+    def _fast_convert(self, sql_query: str) -> Optional[Dict]:
+        """
+        Convert with the hand-written parser, or return None when the query
+        falls outside the supported subset and needs the sqlparse path.
+        """
+        try:
+            tokens = _tokenize(sql_query)
+
+            # Locate top-level clause boundaries in one pass
+            boundaries = {}
+            depth = 0
+            for i, (kind, value) in enumerate(tokens):
+                if kind == "punct":
+                    if value == "(":
+                        depth += 1
+                    elif value == ")":
+                        depth -= 1
+                elif kind == "word" and depth == 0:
+                    word = value.upper()
+                    if word == "WHERE":
+                        boundaries["WHERE"] = i
+                    elif word == "ORDER" and i + 1 < len(tokens) and tokens[i + 1][1].upper() == "BY":
+                        boundaries["ORDER"] = i
+                    elif word == "LIMIT":
+                        boundaries["LIMIT"] = i
+                    elif word == "OFFSET":
+                        boundaries["OFFSET"] = i
+
+            starts = sorted(boundaries.values())
+
+            def clause(name: str, skip: int) -> Optional[list]:
+                if name not in boundaries:
+                    return None
+                start = boundaries[name]
+                end = next((s for s in starts if s > start), len(tokens))
+                return tokens[start + skip:end]
+
+            builder = DirectusQueryBuilder()
+
+            where_tokens = clause("WHERE", 1)
+            if where_tokens:
+                parser = _FastParser(where_tokens)
+                conditions, logic_op = parser.parse_expr()
+                if parser.peek() is not None:
+                    raise _FastParseError("trailing tokens in WHERE clause")
+                if logic_op == "_or":
+                    conditions = [{"_or": conditions}]
+                builder.and_condition(conditions)
+
+            order_tokens = clause("ORDER", 2)
+            if order_tokens:
+                builder.sort(*self._parse_order_tokens(order_tokens))
+
+            for name in ("LIMIT", "OFFSET"):
+                value_tokens = clause(name, 1)
+                if value_tokens:
+                    if len(value_tokens) != 1 or value_tokens[0][0] != "num":
+                        raise _FastParseError(f"bad {name} value")
+                    getattr(builder, name.lower())(int(value_tokens[0][1]))
+
+            return builder.build()
+        except _FastParseError:
+            return None
+
+    @staticmethod
+    def _parse_order_tokens(order_tokens: List[Tuple[str, str]]) -> List[str]:
+        """Parse the token slice after ORDER BY into Directus sort fields"""
+        fields = []
+        i = 0
+        while i < len(order_tokens):
+            kind, value = order_tokens[i]
+            if kind != "word":
+                raise _FastParseError("expected a field name in ORDER BY")
+            field = value
+            i += 1
+            if i < len(order_tokens) and order_tokens[i][0] == "word":
+                direction = order_tokens[i][1].upper()
+                if direction == "DESC":
+                    field = "-" + field
+                elif direction != "ASC":
+                    raise _FastParseError(f"bad ORDER BY direction {direction!r}")
+                i += 1
+            fields.append(field)
+            if i < len(order_tokens):
+                if order_tokens[i] != ("punct", ","):
+                    raise _FastParseError("expected ',' in ORDER BY")
+                i += 1
+        return fields
+
+    def _convert_uncached(self, sql_query: str) -> Dict:
+        """Convert an already-normalized SQL query, bypassing the cache"""
+        result = self._fast_convert(sql_query)
+        if result is not None:
+            return result
+
+        parsed = sqlparse.parse(sql_query)[0]
+
+        # Find WHERE clause
+        where_clause = None
+        for token in parsed.tokens:
+            if isinstance(token, Where):
+                where_clause = token
+                break
+
+        # Tail clauses (ORDER BY / LIMIT / OFFSET) come from one lazy pass
+        order_fields, limit_value, offset_value = self._extract_tail(parsed)
+
+        # Build the query using DirectusQueryBuilder
+        builder = DirectusQueryBuilder()
+
+        # Add WHERE conditions if present
+        if where_clause:
+            conditions = self._parse_where_conditions(where_clause)
+            builder.and_condition(conditions)
+
+        if order_fields:
+            builder.sort(*order_fields)
+
+        # Add limit and offset if present
+        if limit_value is not None:
+            builder.limit(limit_value)
+        if offset_value is not None:
+            builder.offset(offset_value)
+
+        return builder.build()
+
+# Token-type dispatch for the WHERE walkers: a type() keyed lookup is a
+# single pointer read, where isinstance chains walk the MRO per token
+_TOKEN_HANDLERS = {
+    Comparison: SQLToDirectusConverter._handle_comparison,
+    sqlparse.sql.Parenthesis: SQLToDirectusConverter._handle_parenthesis,
+}
+
+
+@lru_cache(maxsize=256)
+def _convert_cached(sql_query: str) -> Dict:
+    return SQLToDirectusConverter()._convert_uncached(sql_query)
@@ -32,6 +32,13 @@ setup(
         "urllib3",
         "sqlparse",
     ],
+    extras_require={
+        "fast": ["orjson"],
+        "http2": ["httpx[http2]"],
+        "async": ["aiohttp"],
+        "upload": ["requests-toolbelt"],
+        "brotli": ["brotli"],
+    },
     entry_points={
         "console_scripts": [
             "directus-sdk-py=directus_sdk_py.__main__:main",